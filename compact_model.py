@@ -0,0 +1,202 @@
+import json
+import struct
+import numpy as np
+
+# Blob layout (little-endian):
+#   header   MAGIC, version u8, n_features u8, n_trees u16, depth u8, base_margin f32
+#   names    u16 byte length + newline-separated UTF-8 feature names
+#   edges    u16 edge count per feature, then all edges as f32
+#   trees    split feature u8 and split edge index u16 per internal node, leaf values f16,
+#            each as (n_trees, 2**depth - 1) / (n_trees, 2**depth) complete binary trees
+MAGIC = b'DPCM'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sBBHBf')
+
+class CompactScorer:
+    """NumPy-only scorer for a quantized, packed copy of the trained XGBoost model.
+
+    Takes raw (unscaled) feature rows: the StandardScaler is folded into the split edges.
+    Each row is binned once per feature, then every tree is walked level by level for all
+    rows at once, so scoring cost is depth x trees vectorised NumPy gathers.
+    """
+
+    def __init__(self, feature_names, edges, split_feature, split_edge, leaves, base_margin):
+        self.feature_names = list(feature_names)
+        self.edges = edges
+        self.split_feature = split_feature
+        self.split_edge = split_edge
+        self.leaves = leaves
+        self.base_margin = base_margin
+        self.depth = int(np.log2(leaves.shape[1]))
+        self._trees = np.arange(leaves.shape[0])
+
+    @property
+    def nbytes(self):
+        """Bytes held by the scorer's arrays."""
+        return sum(a.nbytes for a in self.edges) + self.split_feature.nbytes + self.split_edge.nbytes + self.leaves.nbytes
+
+    def predict_proba(self, X):
+        """P(diabetes) for an (n, n_features) array of raw feature values in feature_names order."""
+        X = np.atleast_2d(np.asarray(X, dtype=np.float32))
+        # bins[i, f] = number of feature-f edges <= x; a node goes left when bins <= its edge index
+        bins = np.empty(X.shape, dtype=np.int32)
+        for f, edges in enumerate(self.edges):
+            bins[:, f] = np.searchsorted(edges, X[:, f], side='right')
+        node = np.zeros((len(X), len(self._trees)), dtype=np.int64)
+        rows = np.arange(len(X))[:, None]
+        for _ in range(self.depth):
+            feature = self.split_feature[self._trees, node]
+            right = bins[rows, feature] > self.split_edge[self._trees, node]
+            node = 2 * node + 1 + right
+        leaf = node - (2 ** self.depth - 1)
+        margin = self.base_margin + self.leaves[self._trees, leaf].astype(np.float32).sum(axis=1)
+        return 1 / (1 + np.exp(-margin))
+
+    def to_bytes(self):
+        names = "\n".join(self.feature_names).encode()
+        parts = [
+            _HEADER.pack(MAGIC, FORMAT_VERSION, len(self.edges), len(self._trees), self.depth, self.base_margin),
+            struct.pack('<H', len(names)), names,
+            np.array([len(e) for e in self.edges], dtype='<u2').tobytes()
+        ]
+        parts += [e.astype('<f4').tobytes() for e in self.edges]
+        parts += [self.split_feature.astype('u1').tobytes(), self.split_edge.astype('<u2').tobytes(),
+                  self.leaves.astype('<f2').tobytes()]
+        return b''.join(parts)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def from_bytes(cls, blob):
+        magic, version, n_features, n_trees, depth, base_margin = _HEADER.unpack_from(blob)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Not a version {FORMAT_VERSION} compact model")
+        offset = _HEADER.size
+        (name_length,) = struct.unpack_from('<H', blob, offset)
+        offset += 2
+        names = blob[offset:offset + name_length].decode().split("\n")
+        offset += name_length
+
+        def take(dtype, count):
+            nonlocal offset
+            array = np.frombuffer(blob, dtype=dtype, count=count, offset=offset)
+            offset += array.nbytes
+            return array
+
+        counts = take('<u2', n_features)
+        edges = [take('<f4', int(count)) for count in counts]
+        n_internal, n_leaves = 2 ** depth - 1, 2 ** depth
+        split_feature = take('u1', n_trees * n_internal).reshape(n_trees, n_internal)
+        split_edge = take('<u2', n_trees * n_internal).reshape(n_trees, n_internal)
+        leaves = take('<f2', n_trees * n_leaves).reshape(n_trees, n_leaves)
+        return cls(names, edges, split_feature, split_edge, leaves, base_margin)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+def _raw_edge(split, mean, scale, train_values):
+    """Map a scaled-space split onto a float32 raw-space edge.
+
+    The unscaled threshold is kept inside the bin between the largest training value the
+    booster sends left and the smallest it sends right (reproducing XGBoost's float32
+    comparison), so every value seen in training takes the same branch as in the original.
+    """
+    scaled = ((train_values - mean) / scale).astype(np.float32)
+    k = int(np.count_nonzero(scaled < np.float32(split)))
+    edge = np.float32(split * scale + mean)
+    if k > 0:
+        edge = max(edge, np.nextafter(np.float32(train_values[k - 1]), np.float32(np.inf)))
+    if k < len(train_values):
+        edge = min(edge, np.float32(train_values[k]))
+    return edge
+
+def export_compact(model, scaler, X_train, feature_names=None):
+    """Build a CompactScorer from a fitted XGBClassifier and the scaler/training data it was fitted with."""
+    booster = model.get_booster()
+    if feature_names is None:
+        feature_names = [str(col) for col in getattr(X_train, 'columns', range(np.shape(X_train)[1]))]
+    X_train = np.asarray(X_train, dtype=float)
+    n_features = X_train.shape[1]
+    uniques = [np.unique(X_train[:, f]) for f in range(n_features)]
+
+    trees = booster.trees_to_dataframe()
+    trees = trees.set_index('ID')
+    splits = trees[trees['Feature'] != 'Leaf']
+    feature_index = splits['Feature'].str[1:].astype(int)
+    raw_edges = [
+        _raw_edge(split, scaler.mean_[f], scaler.scale_[f], uniques[f])
+        for split, f in zip(splits['Split'], feature_index)
+    ]
+    edges = [np.unique(np.array([e for e, f in zip(raw_edges, feature_index) if f == i], dtype=np.float32))
+             for i in range(n_features)]
+    node_edge = {node_id: (f, int(np.searchsorted(edges[f], e))) for node_id, f, e in zip(splits.index, feature_index, raw_edges)}
+
+    def node_depth(node_id):
+        row = trees.loc[node_id]
+        if row['Feature'] == 'Leaf':
+            return 0
+        return 1 + max(node_depth(row['Yes']), node_depth(row['No']))
+
+    n_trees = int(trees['Tree'].max()) + 1
+    depth = max(node_depth(f"{t}-0") for t in range(n_trees))
+    split_feature = np.zeros((n_trees, 2 ** depth - 1), dtype=np.uint8)
+    split_edge = np.zeros((n_trees, 2 ** depth - 1), dtype=np.uint16)
+    leaves = np.zeros((n_trees, 2 ** depth), dtype=np.float16)
+
+    def fill(t, node_id, position, level):
+        row = trees.loc[node_id]
+        if level == depth:
+            leaves[t, position - (2 ** depth - 1)] = row['Gain']
+            return
+        if row['Feature'] == 'Leaf':
+            # Pad shallow leaves to full depth with an always-left split (bins never exceed the edge count)
+            split_feature[t, position] = 0
+            split_edge[t, position] = len(edges[0])
+            fill(t, node_id, 2 * position + 1, level + 1)
+            fill(t, node_id, 2 * position + 2, level + 1)
+            return
+        split_feature[t, position], split_edge[t, position] = node_edge[node_id]
+        fill(t, row['Yes'], 2 * position + 1, level + 1)
+        fill(t, row['No'], 2 * position + 2, level + 1)
+
+    for t in range(n_trees):
+        fill(t, f"{t}-0", 0, 0)
+
+    config = json.loads(booster.save_config())
+    base_score = float(config['learner']['learner_model_param']['base_score'].strip('[]'))
+    base_margin = float(np.log(base_score / (1 - base_score)))
+    return CompactScorer(feature_names, edges, split_feature, split_edge, leaves, base_margin)
+
+def compare(compact, model, scaler, X):
+    """Size, memory and accuracy of the compact scorer against the original model on raw rows X."""
+    original = model.predict_proba(scaler.transform(X))[:, 1]
+    deviation = np.abs(compact.predict_proba(np.asarray(X, dtype=float)) - original)
+    return {
+        'artifact_bytes': len(compact.to_bytes()),
+        'original_artifact_bytes': len(model.get_booster().save_raw('ubj')),
+        'memory_bytes': compact.nbytes,
+        'max_probability_deviation': float(deviation.max()),
+        'mean_probability_deviation': float(deviation.mean())
+    }
+
+if __name__ == "__main__":
+    # Export path only; loading and scoring a saved blob needs nothing but NumPy
+    import sys
+    from data_loader import load_data
+    from data_cleaner import clean_data
+    from model_trainer import train_model
+
+    data = load_data()
+    if data is None:
+        raise SystemExit("Failed to load data")
+    data = clean_data(data)
+    model, scaler, X_train, X_test, _, _, _ = train_model(data.drop('Outcome', axis=1), data['Outcome'])
+    compact = export_compact(model, scaler, X_train)
+    path = sys.argv[1] if len(sys.argv) > 1 else "compact_model.bin"
+    compact.save(path)
+    for key, value in compare(CompactScorer.load(path), model, scaler, X_test).items():
+        print(f"{key}: {value}")
\ No newline at end of file
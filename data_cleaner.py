@@ -1,35 +1,69 @@
 import pandas as pd
 import numpy as np
 
-def clean_data(data):
-    """Clean dataset: handle zeros, impute missing values, cap outliers, and add features."""
+# Model input columns, in the order clean_data produces them
+FEATURE_COLUMNS = ['Pregnancies', 'Glucose', 'BloodPressure', 'SkinThickness', 'Insulin',
+                   'BMI', 'DiabetesPedigreeFunction', 'Age', 'Glucose_BMI']
+
+# Medically plausible ranges, applied after IQR capping
+PLAUSIBLE_RANGES = {
+    'Glucose': (40, 200),
+    'BloodPressure': (40, 140),
+    'BMI': (15, 50),
+    'Insulin': (10, 400),
+    'SkinThickness': (5, 60)
+}
+
+# Columns where 0 is a missing-value marker rather than a measurement
+ZERO_AS_MISSING = ['Glucose', 'BloodPressure', 'SkinThickness', 'Insulin', 'BMI']
+
+def impute_missing(data):
+    """Replace invalid zeros with NaN and impute them with column medians."""
     data = data.copy()
     
     # Replace invalid zeros with NaN
-    cols_with_zeros = ['Glucose', 'BloodPressure', 'SkinThickness', 'Insulin', 'BMI']
-    data[cols_with_zeros] = data[cols_with_zeros].replace(0, np.nan)
+    data[ZERO_AS_MISSING] = data[ZERO_AS_MISSING].replace(0, np.nan)
     
     # Impute missing values with median
     data.fillna(data.median(), inplace=True)
-    
-    # Cap outliers using IQR method
+    return data
+
+def iqr_bounds(data):
+    """Per-column (lower, upper) outlier caps from the IQR method, fitted on imputed data."""
+    bounds = {}
     for col in ['Pregnancies', 'Glucose', 'BloodPressure', 'SkinThickness', 'Insulin', 
                 'BMI', 'DiabetesPedigreeFunction', 'Age']:
         Q1 = data[col].quantile(0.25)
         Q3 = data[col].quantile(0.75)
         IQR = Q3 - Q1
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
+        bounds[col] = (Q1 - 1.5 * IQR, Q3 + 1.5 * IQR)
+    return bounds
+
+def clean_data(data):
+    """Clean dataset: handle zeros, impute missing values, cap outliers, and add features."""
+    data = impute_missing(data)
+    
+    # Cap outliers using IQR method
+    for col, (lower_bound, upper_bound) in iqr_bounds(data).items():
         data[col] = data[col].clip(lower=lower_bound, upper=upper_bound)
     
     # Validate ranges (based on medical plausibility)
-    data['Glucose'] = data['Glucose'].clip(lower=40, upper=200)
-    data['BloodPressure'] = data['BloodPressure'].clip(lower=40, upper=140)
-    data['BMI'] = data['BMI'].clip(lower=15, upper=50)
-    data['Insulin'] = data['Insulin'].clip(lower=10, upper=400)
-    data['SkinThickness'] = data['SkinThickness'].clip(lower=5, upper=60)
+    for col, (lower_bound, upper_bound) in PLAUSIBLE_RANGES.items():
+        data[col] = data[col].clip(lower=lower_bound, upper=upper_bound)
     
     # Feature engineering: Glucose * BMI
     data['Glucose_BMI'] = data['Glucose'] * data['BMI']
     
-    return data
\ No newline at end of file
+    return data
+
+def recompute_glucose_bmi(X):
+    """Refresh the Glucose_BMI column of a raw feature matrix in place after Glucose or BMI changed."""
+    X[:, FEATURE_COLUMNS.index('Glucose_BMI')] = X[:, FEATURE_COLUMNS.index('Glucose')] * X[:, FEATURE_COLUMNS.index('BMI')]
+    return X
+
+def record_to_row(record):
+    """Turn one patient (dict, Series or single-row DataFrame) into a raw feature row."""
+    if isinstance(record, pd.DataFrame):
+        record = record.iloc[0]
+    row = np.array([[float(record[col]) for col in FEATURE_COLUMNS[:-1]] + [0.0]])
+    return recompute_glucose_bmi(row)[0]
\ No newline at end of file
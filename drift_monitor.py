@@ -0,0 +1,150 @@
+import queue
+import threading
+from collections import deque
+import numpy as np
+import pandas as pd
+import streamlit as st
+from data_cleaner import FEATURE_COLUMNS, PLAUSIBLE_RANGES, ZERO_AS_MISSING, impute_missing, iqr_bounds
+
+INPUT_COLUMNS = FEATURE_COLUMNS[:-1]
+
+# Floor for empty bins so PSI stays finite
+_EPS = 1e-4
+
+def _bin_edges(values, n_bins):
+    """Reference quantile edges; duplicates from discrete features (e.g. Pregnancies) are merged."""
+    return np.unique(np.quantile(values, np.linspace(0, 1, n_bins + 1)[1:-1]))
+
+def _bin_counts(edges, values):
+    """Counts over (-inf, e0], (e0, e1], ..., (ek, inf)."""
+    return np.bincount(np.searchsorted(edges, values, side='left'), minlength=len(edges) + 1)
+
+def psi(expected, actual):
+    """Population Stability Index between two binned distributions."""
+    p = np.maximum(expected / expected.sum(), _EPS)
+    q = np.maximum(actual / max(actual.sum(), 1), _EPS)
+    return float(np.sum((q - p) * np.log(q / p)))
+
+def ks(expected, actual):
+    """Kolmogorov-Smirnov statistic evaluated at the shared bin edges."""
+    cdf_p = np.cumsum(expected) / expected.sum()
+    cdf_q = np.cumsum(actual) / max(actual.sum(), 1)
+    return float(np.abs(cdf_p - cdf_q).max())
+
+class DriftMonitor:
+    """Compare scored inputs with the training reference using fixed-size streaming histograms.
+
+    observe() only enqueues the row, so predictions never wait on the monitor; a daemon
+    thread folds rows into per-feature bin counts, clip-bound hit counters and missing-value
+    (zero) counters. Zeros in ZERO_AS_MISSING columns are imputed by clean_data, not clipped,
+    so they are counted as missing rather than as lower-bound hits. Every
+    window_size rows it computes PSI/KS per feature against the reference and resets the
+    window. Memory is constant: n_bins + 1 counters per feature and the last max_reports reports.
+    """
+
+    def __init__(self, reference, n_bins=20, window_size=500, max_reports=24, queue_size=10000):
+        reference = reference[INPUT_COLUMNS]
+        self.window_size = window_size
+        self.edges = {col: _bin_edges(reference[col].to_numpy(dtype=float), n_bins) for col in INPUT_COLUMNS}
+        self.reference_counts = {col: _bin_counts(self.edges[col], reference[col].to_numpy(dtype=float))
+                                 for col in INPUT_COLUMNS}
+
+        # Bounds clean_data fitted on this reference; scored inputs are never clipped, so hits flag drift
+        self.bounds = {col: {'IQR': bound} for col, bound in iqr_bounds(impute_missing(reference)).items()}
+        for col, bound in PLAUSIBLE_RANGES.items():
+            self.bounds[col]['Plausible'] = bound
+        self.reference_missing = {col: float((reference[col] == 0).mean()) for col in ZERO_AS_MISSING}
+
+        self.reports = deque(maxlen=max_reports)
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._reset_window()
+        self._worker = threading.Thread(target=self._run, name="drift-monitor", daemon=True)
+        self._worker.start()
+
+    def _reset_window(self):
+        self._counts = {col: np.zeros(len(self.edges[col]) + 1, dtype=np.int64) for col in INPUT_COLUMNS}
+        self._hits = {(col, kind, side): 0 for col, kinds in self.bounds.items() for kind in kinds
+                      for side in ('lower', 'upper')}
+        self._missing = {col: 0 for col in ZERO_AS_MISSING}
+        self._n = 0
+
+    def observe(self, rows):
+        """Queue scored inputs (DataFrame with the form columns); never blocks the caller."""
+        try:
+            self._queue.put_nowait(rows[INPUT_COLUMNS].to_numpy(dtype=float))
+        except queue.Full:
+            self.dropped += len(rows)
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            # Drain whatever else is waiting so bursts are folded in with one NumPy pass
+            batches = [batch]
+            while True:
+                try:
+                    batch = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if batch is None:
+                    self._update(np.vstack(batches))
+                    return
+                batches.append(batch)
+            self._update(np.vstack(batches))
+
+    def _update(self, X):
+        with self._lock:
+            while len(X):
+                take = X[:self.window_size - self._n]
+                X = X[len(take):]
+                for j, col in enumerate(INPUT_COLUMNS):
+                    values = take[:, j]
+                    self._counts[col] += _bin_counts(self.edges[col], values)
+                    if col in self._missing:
+                        missing = values == 0
+                        self._missing[col] += int(missing.sum())
+                        values = values[~missing]
+                    for kind, (lower, upper) in self.bounds.get(col, {}).items():
+                        self._hits[(col, kind, 'lower')] += int((values < lower).sum())
+                        self._hits[(col, kind, 'upper')] += int((values > upper).sum())
+                self._n += len(take)
+                if self._n >= self.window_size:
+                    self.reports.append(self._window_report())
+                    self._reset_window()
+
+    def _window_report(self):
+        drift = pd.DataFrame({
+            'PSI': [psi(self.reference_counts[col], self._counts[col]) for col in INPUT_COLUMNS],
+            'KS': [ks(self.reference_counts[col], self._counts[col]) for col in INPUT_COLUMNS]
+        }, index=INPUT_COLUMNS)
+        clip_hits = pd.DataFrame(
+            [(col, kind, side, self.bounds[col][kind][0 if side == 'lower' else 1], hits, hits / self._n)
+             for (col, kind, side), hits in self._hits.items()],
+            columns=['Feature', 'Bound', 'Side', 'Value', 'Hits', 'Rate']
+        ).sort_values('Hits', ascending=False, ignore_index=True)
+        missing = pd.DataFrame({
+            'Zeros': [self._missing[col] for col in ZERO_AS_MISSING],
+            'Rate': [self._missing[col] / self._n for col in ZERO_AS_MISSING],
+            'Reference Rate': [self.reference_missing[col] for col in ZERO_AS_MISSING]
+        }, index=ZERO_AS_MISSING)
+        return {'rows': self._n, 'drift': drift, 'clip_hits': clip_hits, 'missing': missing}
+
+    def report(self, partial=True):
+        """Latest window report; with partial=True the still-open window is reported if it has rows."""
+        with self._lock:
+            if partial and self._n:
+                return self._window_report()
+            return self.reports[-1] if self.reports else None
+
+    def close(self, timeout=5):
+        """Stop the background thread after it has drained queued rows."""
+        self._queue.put(None)
+        self._worker.join(timeout)
+
+@st.cache_resource
+def get_drift_monitor(reference):
+    """One monitor per server process, shared by every page and session."""
+    return DriftMonitor(reference)
\ No newline at end of file
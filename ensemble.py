@@ -0,0 +1,138 @@
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from data_cleaner import FEATURE_COLUMNS
+
+def _splitmix64(keys):
+    """splitmix64 finaliser: spreads sequential integers uniformly over 64 bits."""
+    z = keys.astype(np.int64).view(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+def route_positions(route_keys):
+    """Map routing keys to stable positions in [0, 1).
+
+    Every key is hashed before bucketing so sequential IDs spread across models: integers
+    (and booleans) with splitmix64, strings with MD5 (not hash(), which is salted per process).
+    """
+    keys = np.atleast_1d(np.asarray(route_keys))
+    if keys.dtype.kind in 'iub':
+        hashed = _splitmix64(keys)
+    else:
+        hashed = np.array([int.from_bytes(hashlib.md5(str(key).encode()).digest()[:8], 'little') for key in keys],
+                          dtype=np.uint64)
+    return (hashed % np.uint64(10000)) / 10000
+
+class ModelEnsemble:
+    """Serve several candidate models behind one preprocessing step.
+
+    Each batch is scaled once, then the same matrix (column-sliced for models trained on a
+    feature subset) is scored by every model in parallel threads; XGBoost and scikit-learn
+    release the GIL while predicting. Results are either combined by weighted averaging or,
+    for A/B tests, each row is routed to one model according to traffic shares.
+    """
+
+    def __init__(self, models, scaler, weights=None, shares=None):
+        self.models = models
+        self.scaler = scaler
+        self.names = list(models)
+        self.weights = self._normalise(weights)
+        self.shares = self._normalise(shares)
+        self._pool = ThreadPoolExecutor(max_workers=len(models), thread_name_prefix="ensemble")
+
+    def _normalise(self, values):
+        unknown = set(values or {}) - set(self.names)
+        if unknown:
+            raise ValueError(f"Unknown models {sorted(unknown)} in weights/shares; choose from {self.names}")
+        values = np.array([1.0] * len(self.names) if values is None else [values.get(name, 0.0) for name in self.names])
+        if values.sum() <= 0:
+            raise ValueError("Weights/shares must sum to a positive value")
+        return values / values.sum()
+
+    def _score(self, name, X_scaled):
+        start = time.perf_counter()
+        model, idx = self.models[name]
+        proba = model.predict_proba(X_scaled[:, idx])[:, 1]
+        return proba, (time.perf_counter() - start) * 1000
+
+    def predict(self, X, mode="average", route_keys=None):
+        """Score raw feature rows.
+
+        mode="average" blends every model with the configured weights. mode="route" sends each
+        row to one model by traffic share; route_keys (integers such as a session hash, negative
+        allowed, or strings such as a session ID) make the assignment sticky, otherwise it is random. Returns a dict with 'probability', 'model'
+        (per-row model name, or 'ensemble'), 'latency_ms' per model, 'preprocess_ms',
+        'total_ms' and 'overhead_ms' (time not spent preprocessing or in the slowest model).
+        """
+        start = time.perf_counter()
+        if not isinstance(X, pd.DataFrame):
+            X = pd.DataFrame(X, columns=FEATURE_COLUMNS)
+        X_scaled = self.scaler.transform(X[FEATURE_COLUMNS])
+        preprocess_ms = (time.perf_counter() - start) * 1000
+
+        if mode == "average":
+            futures = {name: self._pool.submit(self._score, name, X_scaled) for name in self.names}
+            results = {name: future.result() for name, future in futures.items()}
+            probability = sum(weight * results[name][0] for name, weight in zip(self.names, self.weights))
+            assigned = np.full(len(X), "ensemble", dtype=object)
+        elif mode == "route":
+            if route_keys is None:
+                position = np.random.default_rng().random(len(X))
+            else:
+                position = route_positions(route_keys)
+            choice = np.searchsorted(np.cumsum(self.shares), position, side='right').clip(max=len(self.names) - 1)
+            futures = {name: self._pool.submit(self._score, name, X_scaled[choice == i])
+                       for i, name in enumerate(self.names) if (choice == i).any()}
+            results = {name: future.result() for name, future in futures.items()}
+            probability = np.empty(len(X))
+            for i, name in enumerate(self.names):
+                if name in results:
+                    probability[choice == i] = results[name][0]
+            assigned = np.array(self.names, dtype=object)[choice]
+        else:
+            raise ValueError(f"Unknown mode {mode!r}; use 'average' or 'route'")
+
+        total_ms = (time.perf_counter() - start) * 1000
+        latency_ms = {name: result[1] for name, result in results.items()}
+        return {
+            'probability': probability,
+            'model': assigned,
+            'latency_ms': latency_ms,
+            'preprocess_ms': preprocess_ms,
+            'total_ms': total_ms,
+            'overhead_ms': total_ms - preprocess_ms - max(latency_ms.values(), default=0.0)
+        }
+
+    def close(self):
+        self._pool.shutdown(wait=False)
+
+if __name__ == "__main__":
+    # Latency budget report for the default candidates
+    from data_loader import load_data
+    from data_cleaner import clean_data
+    from model_trainer import train_candidates
+
+    data = load_data()
+    if data is None:
+        raise SystemExit("Failed to load data")
+    data = clean_data(data)
+    models, scaler, X_test, y_test, accuracies = train_candidates(data.drop('Outcome', axis=1), data['Outcome'])
+    ensemble = ModelEnsemble(models, scaler)
+    for name, accuracy in accuracies.items():
+        print(f"{name:20s} accuracy {accuracy:.2%}")
+    ensemble_accuracy = np.mean((ensemble.predict(X_test)['probability'] > 0.5) == y_test.to_numpy())
+    print(f"{'ensemble (average)':20s} accuracy {ensemble_accuracy:.2%}")
+
+    for batch_size in (1, 100, 10000):
+        X = X_test.sample(batch_size, replace=True, random_state=42)
+        for mode in ("average", "route"):
+            runs = [ensemble.predict(X, mode=mode) for _ in range(20)]
+            latency = {name: np.nanmedian([run['latency_ms'].get(name, np.nan) for run in runs]) for name in ensemble.names}
+            print(f"batch={batch_size:<6d} {mode:8s} total {np.median([r['total_ms'] for r in runs]):7.2f} ms  "
+                  f"preprocess {np.median([r['preprocess_ms'] for r in runs]):6.2f} ms  "
+                  f"overhead {np.median([r['overhead_ms'] for r in runs]):6.2f} ms  "
+                  + "  ".join(f"{name} {ms:.2f}" for name, ms in latency.items()))
+    ensemble.close()
\ No newline at end of file
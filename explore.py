@@ -5,6 +5,8 @@ import seaborn as sns
 from data_loader import load_data
 from data_cleaner import clean_data
 from model_trainer import train_model
+from drift_monitor import get_drift_monitor, INPUT_COLUMNS
+from profiling import request_profiler
 
 # Set page configuration to hide default sidebar menu
 st.set_page_config(page_title="Explore - Diabetes Prediction App", layout="wide")
@@ -88,7 +90,7 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-def main():
+def main(profiler):
     # Custom sidebar with navigation
     with st.sidebar:
         st.markdown("<h2 style='color: #ffffff;'>Navigation</h2>", unsafe_allow_html=True)
@@ -103,18 +105,22 @@ def main():
     st.markdown("Dive into the PIMA Indians Diabetes Dataset and analyze the XGBoost model's performance with interactive visualizations.")
 
     # Load and prepare data
-    data = load_data()
+    with profiler.stage("load_data"):
+        data = load_data()
     if data is None:
         st.error("Failed to load data. Please try again later.")
         return
     
-    data = clean_data(data)
+    drift_monitor = get_drift_monitor(data[INPUT_COLUMNS])
+    with profiler.stage("clean_data"):
+        data = clean_data(data)
     X = data.drop('Outcome', axis=1)
     y = data['Outcome']
     
     # Train model
     try:
-        model, scaler, X_train, X_test, accuracy, conf_matrix, class_report = train_model(X, y)
+        with profiler.stage("train_model"):
+            model, scaler, X_train, X_test, accuracy, conf_matrix, class_report = train_model(X, y)
     except Exception as e:
         st.error(f"Error training model: {e}")
         return
@@ -129,66 +135,70 @@ def main():
     # Visualizations
     st.header("Visualizations")
     st.subheader("Feature Distributions")
-    try:
-        fig, axes = plt.subplots(2, 5, figsize=(20, 8))
-        axes = axes.ravel()
-        for idx, col in enumerate(X.columns):
-            sns.histplot(data[col], ax=axes[idx], kde=True, bins=20, color='#007bff', edgecolor='#ffffff')
-            axes[idx].set_title(col, fontsize=10, color='#ffffff')
-            axes[idx].set_facecolor('#1a1a1a')
-            axes[idx].tick_params(axis='x', colors='#ffffff')
-            axes[idx].tick_params(axis='y', colors='#ffffff')
-            axes[idx].grid(True, color='#333333', linestyle='--', alpha=0.5)
-        plt.tight_layout()
-        plt.savefig('feature_distributions.png', transparent=True)
-        st.image('feature_distributions.png')
-    except Exception as e:
-        st.error(f"Error generating histograms: {e}")
+    with profiler.stage("render_distributions"):
+        try:
+            fig, axes = plt.subplots(2, 5, figsize=(20, 8))
+            axes = axes.ravel()
+            for idx, col in enumerate(X.columns):
+                sns.histplot(data[col], ax=axes[idx], kde=True, bins=20, color='#007bff', edgecolor='#ffffff')
+                axes[idx].set_title(col, fontsize=10, color='#ffffff')
+                axes[idx].set_facecolor('#1a1a1a')
+                axes[idx].tick_params(axis='x', colors='#ffffff')
+                axes[idx].tick_params(axis='y', colors='#ffffff')
+                axes[idx].grid(True, color='#333333', linestyle='--', alpha=0.5)
+            plt.tight_layout()
+            plt.savefig('feature_distributions.png', transparent=True)
+            st.image('feature_distributions.png')
+        except Exception as e:
+            st.error(f"Error generating histograms: {e}")
     
     st.subheader("Correlation Heatmap")
-    try:
-        fig, ax = plt.subplots(figsize=(8, 6))
-        sns.heatmap(data.corr(), annot=True, cmap='coolwarm', ax=ax, fmt='.2f', cbar_kws={'label': 'Correlation'})
-        ax.set_facecolor('#1a1a1a')
-        ax.tick_params(axis='x', colors='#ffffff')
-        ax.tick_params(axis='y', colors='#ffffff')
-        ax.set_title("Correlation Heatmap", color='#ffffff')
-        plt.savefig('correlation_heatmap.png', transparent=True)
-        st.image('correlation_heatmap.png')
-    except Exception as e:
-        st.error(f"Error generating heatmap: {e}")
+    with profiler.stage("render_heatmap"):
+        try:
+            fig, ax = plt.subplots(figsize=(8, 6))
+            sns.heatmap(data.corr(), annot=True, cmap='coolwarm', ax=ax, fmt='.2f', cbar_kws={'label': 'Correlation'})
+            ax.set_facecolor('#1a1a1a')
+            ax.tick_params(axis='x', colors='#ffffff')
+            ax.tick_params(axis='y', colors='#ffffff')
+            ax.set_title("Correlation Heatmap", color='#ffffff')
+            plt.savefig('correlation_heatmap.png', transparent=True)
+            st.image('correlation_heatmap.png')
+        except Exception as e:
+            st.error(f"Error generating heatmap: {e}")
     
     st.subheader("Feature Importance")
-    try:
-        fig, ax = plt.subplots(figsize=(8, 5))
-        feat_importance = pd.Series(model.feature_importances_, index=X.columns)
-        feat_importance.sort_values().plot(kind='barh', ax=ax, color='#007bff')
-        ax.set_title("Feature Importance in XGBoost Model", color='#ffffff')
-        ax.set_facecolor('#1a1a1a')
-        ax.tick_params(axis='x', colors='#ffffff')
-        ax.tick_params(axis='y', colors='#ffffff')
-        plt.savefig('feature_importance.png', transparent=True)
-        st.image('feature_importance.png')
-    except Exception as e:
-        st.error(f"Error generating feature importance: {e}")
+    with profiler.stage("render_feature_importance"):
+        try:
+            fig, ax = plt.subplots(figsize=(8, 5))
+            feat_importance = pd.Series(model.feature_importances_, index=X.columns)
+            feat_importance.sort_values().plot(kind='barh', ax=ax, color='#007bff')
+            ax.set_title("Feature Importance in XGBoost Model", color='#ffffff')
+            ax.set_facecolor('#1a1a1a')
+            ax.tick_params(axis='x', colors='#ffffff')
+            ax.tick_params(axis='y', colors='#ffffff')
+            plt.savefig('feature_importance.png', transparent=True)
+            st.image('feature_importance.png')
+        except Exception as e:
+            st.error(f"Error generating feature importance: {e}")
     
     # Model performance
     st.header("Model Performance")
     st.metric("Accuracy", f"{accuracy:.2%}")
     
     st.subheader("Confusion Matrix")
-    try:
-        fig, ax = plt.subplots(figsize=(5, 4))
-        sns.heatmap(conf_matrix, annot=True, fmt='d', cmap='Blues', ax=ax)
-        ax.set_xlabel("Predicted", color='#ffffff')
-        ax.set_ylabel("Actual", color='#ffffff')
-        ax.set_facecolor('#1a1a1a')
-        ax.tick_params(axis='x', colors='#ffffff')
-        ax.tick_params(axis='y', colors='#ffffff')
-        plt.savefig('confusion_matrix.png', transparent=True)
-        st.image('confusion_matrix.png')
-    except Exception as e:
-        st.error(f"Error generating confusion matrix: {e}")
+    with profiler.stage("render_confusion_matrix"):
+        try:
+            fig, ax = plt.subplots(figsize=(5, 4))
+            sns.heatmap(conf_matrix, annot=True, fmt='d', cmap='Blues', ax=ax)
+            ax.set_xlabel("Predicted", color='#ffffff')
+            ax.set_ylabel("Actual", color='#ffffff')
+            ax.set_facecolor('#1a1a1a')
+            ax.tick_params(axis='x', colors='#ffffff')
+            ax.tick_params(axis='y', colors='#ffffff')
+            plt.savefig('confusion_matrix.png', transparent=True)
+            st.image('confusion_matrix.png')
+        except Exception as e:
+            st.error(f"Error generating confusion matrix: {e}")
     
     st.subheader("Classification Report")
     with st.expander("View Classification Report", expanded=True):
@@ -196,6 +206,21 @@ def main():
         st.write(pd.DataFrame(class_report).transpose())
         st.markdown("</div>", unsafe_allow_html=True)
 
+    # Input drift
+    st.header("Input Drift")
+    st.markdown("Scored inputs compared with the training data (PSI above 0.2 or a large KS suggests drift).")
+    # Only complete windows: PSI/KS over a handful of rows would flag drift on in-distribution data
+    drift_report = drift_monitor.report(partial=False)
+    if drift_report is None:
+        st.info(f"Drift is reported once {drift_monitor.window_size} predictions have been scored since the app started.")
+    else:
+        st.metric("Rows in Last Complete Window", drift_report['rows'])
+        st.write(drift_report['drift'])
+        st.subheader("Most Frequently Hit Clip Bounds")
+        st.write(drift_report['clip_hits'].head(10))
+        st.subheader("Missing Values (Zeros)")
+        st.write(drift_report['missing'])
+
     # Footer
     st.markdown("""
     <div class="footer">
@@ -206,4 +231,6 @@ def main():
     """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
+    # Profiling (if enabled) spans the whole run and is released even on early return
+    with request_profiler() as profiler:
+        main(profiler)
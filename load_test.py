@@ -0,0 +1,180 @@
+import argparse
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from data_loader import load_data
+from data_cleaner import FEATURE_COLUMNS, clean_data, record_to_row
+from model_trainer import train_model, predict_batch
+from response_surface import FORM_RANGES
+from what_if import sweep
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def _rss_mb():
+    """Current resident memory of this process in MB (peak RSS where /proc is unavailable)."""
+    if os.path.exists("/proc/self/statm"):
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return float("nan")
+
+def _patients(data):
+    """Realistic form submissions: dataset rows with valid Glucose, Blood Pressure and BMI."""
+    data = data[(data['Glucose'] > 0) & (data['BloodPressure'] > 0) & (data['BMI'] > 0)]
+    return data[FEATURE_COLUMNS[:-1]].to_dict('records')
+
+class PageUser:
+    """One simulated browser session submitting diabetes_form through Streamlit's AppTest."""
+
+    def __init__(self, patients, seed):
+        from streamlit.testing.v1 import AppTest
+        self.patients = patients
+        self.rng = np.random.default_rng(seed)
+        self.app = AppTest.from_file("predict.py", default_timeout=60)
+        self.app.run()
+
+    def __call__(self):
+        patient = self.patients[self.rng.integers(len(self.patients))]
+        # Form inputs appear in FEATURE_COLUMNS order
+        for widget, col in zip(self.app.number_input, FEATURE_COLUMNS[:-1]):
+            lo, hi, step = FORM_RANGES[col]
+            value = min(max(patient[col], lo), hi)
+            widget.set_value(int(value) if isinstance(step, int) else float(value))
+        submit = next(button for button in self.app.button if button.label == "Predict Risk")
+        submit.click().run()
+        if self.app.exception:
+            raise RuntimeError(self.app.exception[0].message)
+
+class ScoringUser:
+    """One client calling a non-UI scoring entry point directly."""
+
+    def __init__(self, patients, seed, model, scaler, kind):
+        self.patients = patients
+        self.rng = np.random.default_rng(seed)
+        self.model = model
+        self.scaler = scaler
+        self.kind = kind
+
+    def __call__(self):
+        patient = self.patients[self.rng.integers(len(self.patients))]
+        if self.kind == "predict":
+            predict_batch(self.model, self.scaler, record_to_row(patient)[None, :])
+        else:
+            sweep(self.model, self.scaler, patient, {'Glucose': np.linspace(40, 200, 100), 'BMI': np.linspace(15, 50, 100)})
+
+def run_level(users, duration):
+    """Drive every user callable in its own thread for duration seconds and summarise the level."""
+    barrier = threading.Barrier(len(users) + 1)
+    stop = []
+
+    def loop(user):
+        latencies, errors = [], 0
+        barrier.wait()
+        while not stop:
+            start = time.perf_counter()
+            try:
+                user()
+            except Exception:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - start)
+        return latencies, errors
+
+    with ThreadPoolExecutor(len(users)) as pool:
+        futures = [pool.submit(loop, user) for user in users]
+        barrier.wait()
+        wall, cpu = time.perf_counter(), time.process_time()
+        time.sleep(duration)
+        stop.append(True)
+        results = [future.result() for future in futures]
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+    latencies = np.array([latency for result in results for latency in result[0]]) * 1000
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(latencies) else (np.nan,) * 3
+    return {
+        'users': len(users),
+        'requests': len(latencies),
+        'errors': sum(result[1] for result in results),
+        'throughput_rps': len(latencies) / wall,
+        'p50_ms': p50,
+        'p95_ms': p95,
+        'p99_ms': p99,
+        'cpu_pct': 100 * cpu / wall,
+        'rss_mb': _rss_mb()
+    }
+
+def find_knee(levels):
+    """Mark the concurrency with the best throughput per unit of p95 latency (Kleinrock's power).
+
+    Levels without a single successful request are not candidates; if none qualify, no row is marked.
+    """
+    levels = levels.copy()
+    levels['power'] = levels['throughput_rps'] / levels['p95_ms']
+    candidates = levels.loc[levels['requests'] > 0, 'power'].dropna()
+    levels['knee'] = False
+    if len(candidates):
+        levels.loc[candidates.idxmax(), 'knee'] = True
+    return levels
+
+def main():
+    parser = argparse.ArgumentParser(description="Ramp concurrent users against the predict page and scoring functions.")
+    parser.add_argument("--configs", nargs="+", default=["predict", "sweep", "page"], choices=["predict", "sweep", "page"],
+                        help="predict: single-row predict_batch; sweep: 100x100 what_if.sweep; page: predict.py via AppTest")
+    parser.add_argument("--users", nargs="+", type=int, default=[1, 2, 4, 8, 16], help="Concurrency levels to ramp through")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per concurrency level")
+    parser.add_argument("--out", help="Optional CSV path for the full report")
+    args = parser.parse_args()
+
+    # Keep synthetic traffic out of the real prediction log
+    os.environ.setdefault("PREDICTION_LOG_DIR", tempfile.mkdtemp(prefix="load_test_logs_"))
+
+    data = load_data()
+    if data is None:
+        raise SystemExit("Failed to load data")
+    patients = _patients(data)
+    cleaned = clean_data(data)
+    model, scaler, _, _, _, _, _ = train_model(cleaned.drop('Outcome', axis=1), cleaned['Outcome'])
+
+    reports = []
+    for config in args.configs:
+        levels = []
+        for n_users in args.users:
+            if config == "page":
+                users = [PageUser(patients, seed) for seed in range(n_users)]
+            else:
+                users = [ScoringUser(patients, seed, model, scaler, config) for seed in range(n_users)]
+            level = run_level(users, args.duration)
+            print(f"{config:8s} users={n_users:<4d} {level['throughput_rps']:8.1f} req/s  "
+                  f"p95={level['p95_ms']:8.1f} ms  cpu={level['cpu_pct']:5.0f}%  errors={level['errors']}", flush=True)
+            levels.append(level)
+        report = find_knee(pd.DataFrame(levels))
+        report.insert(0, 'config', config)
+        reports.append(report)
+
+    report = pd.concat(reports, ignore_index=True)
+    if args.out:
+        report.to_csv(args.out, index=False)
+    print()
+    print(report.to_string(index=False, float_format=lambda value: f"{value:.2f}"))
+    print()
+    for config, levels in report.groupby('config', sort=False):
+        knee = levels[levels['knee']]
+        if knee.empty:
+            print(f"Knee for {config}: no knee (no level completed a request)")
+            continue
+        knee = knee.iloc[0]
+        print(f"Knee for {config}: {knee['users']} concurrent users "
+              f"({knee['throughput_rps']:.1f} req/s, p95 {knee['p95_ms']:.1f} ms)")
+    # The load generator (including AppTest sessions) runs in this process, so it shares the CPU/RSS figures
+    print("Note: cpu_pct and rss_mb are for this process, which includes the load generator as well as the app.")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
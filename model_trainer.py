@@ -1,24 +1,31 @@
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
+from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+import pandas as pd
 import xgboost as xgb
+from data_cleaner import FEATURE_COLUMNS
 
-def train_model(X, y):
-    """Train and evaluate XGBoost model."""
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-    scaler = StandardScaler()
-    X_train_scaled = scaler.fit_transform(X_train)
-    X_test_scaled = scaler.transform(X_test)
-    
-    model = xgb.XGBClassifier(
+def make_xgb(max_depth=3):
+    """The production XGBoost configuration; candidates vary only the depth."""
+    return xgb.XGBClassifier(
         n_estimators=50,
-        max_depth=3,
+        max_depth=max_depth,
         learning_rate=0.1,
         subsample=0.8,
         colsample_bytree=0.8,
         random_state=42,
         n_jobs=1
     )
+
+def train_model(X, y):
+    """Train and evaluate XGBoost model."""
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+    
+    model = make_xgb()
     model.fit(X_train_scaled, y_train)
     
     y_pred = model.predict(X_test_scaled)
@@ -26,4 +33,40 @@ def train_model(X, y):
     conf_matrix = confusion_matrix(y_test, y_pred)
     class_report = classification_report(y_test, y_pred, output_dict=True)
     
-    return model, scaler, X_train, X_test, accuracy, conf_matrix, class_report
\ No newline at end of file
+    return model, scaler, X_train, X_test, accuracy, conf_matrix, class_report
+
+# Candidate models for A/B tests and ensembles: name -> (factory, input columns)
+CANDIDATE_MODELS = {
+    'xgb_depth3': (make_xgb, FEATURE_COLUMNS),
+    'xgb_depth5': (lambda: make_xgb(max_depth=5), FEATURE_COLUMNS),
+    'xgb_no_glucose_bmi': (make_xgb, FEATURE_COLUMNS[:-1]),
+    'logistic': (lambda: LogisticRegression(max_iter=1000), FEATURE_COLUMNS)
+}
+
+def train_candidates(X, y, candidates=None):
+    """Train several candidate models on the train_model split with one shared scaler.
+
+    Returns {name: (model, column indices)}, the scaler, the raw test split and per-model accuracy.
+    """
+    candidates = candidates or CANDIDATE_MODELS
+    X = X[FEATURE_COLUMNS]
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+    
+    models, accuracies = {}, {}
+    for name, (factory, columns) in candidates.items():
+        idx = [FEATURE_COLUMNS.index(col) for col in columns]
+        model = factory()
+        model.fit(X_train_scaled[:, idx], y_train)
+        models[name] = (model, idx)
+        accuracies[name] = accuracy_score(y_test, model.predict(X_test_scaled[:, idx]))
+    
+    return models, scaler, X_test, y_test, accuracies
+
+def predict_batch(model, scaler, X):
+    """Return P(diabetes) for every row of a raw (unscaled) feature matrix in one booster call."""
+    if not isinstance(X, pd.DataFrame):
+        X = pd.DataFrame(X, columns=FEATURE_COLUMNS)
+    return model.predict_proba(scaler.transform(X))[:, 1]
\ No newline at end of file
@@ -1,10 +1,17 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import time
+import os
 from data_loader import load_data
-from data_cleaner import clean_data
+from data_cleaner import FEATURE_COLUMNS, clean_data
 from model_trainer import train_model
-from suggestions import generate_suggestions
+from suggestions import generate_suggestions, suggestion_rule_ids
+from what_if import sweep
+from drift_monitor import get_drift_monitor, INPUT_COLUMNS
+from prediction_log import get_prediction_log, model_version
+from profiling import request_profiler
+from response_surface import FORM_RANGES, build_surface
 
 # Set page configuration to hide default sidebar menu
 st.set_page_config(page_title="Predict - Diabetes Prediction App", layout="wide")
@@ -104,7 +111,13 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-def main():
+@st.cache_resource(show_spinner="Training model...")
+def get_trained_model(X, y):
+    """Train once per distinct dataset instead of on every rerun."""
+    model, scaler, _, _, _, _, _ = train_model(X, y)
+    return model, scaler, model_version(model)
+
+def main(profiler):
     # Custom sidebar with navigation
     with st.sidebar:
         st.markdown("<h2 style='color: #ffffff;'>Navigation</h2>", unsafe_allow_html=True)
@@ -119,18 +132,22 @@ def main():
     st.markdown("Enter your health metrics to receive a personalized diabetes risk prediction and actionable recommendations.")
 
     # Load and prepare data
-    data = load_data()
+    with profiler.stage("load_data"):
+        data = load_data()
     if data is None:
         st.error("Failed to load data. Please try again later.")
         return
     
-    data = clean_data(data)
+    drift_monitor = get_drift_monitor(data[INPUT_COLUMNS])
+    with profiler.stage("clean_data"):
+        data = clean_data(data)
     X = data.drop('Outcome', axis=1)
     y = data['Outcome']
     
     # Train model
     try:
-        model, scaler, _, _, _, _, _ = train_model(X, y)
+        with profiler.stage("train_model"):
+            model, scaler, version = get_trained_model(X, y)
     except Exception as e:
         st.error(f"Error training model: {e}")
         return
@@ -161,19 +178,22 @@ def main():
     
     # Process submission
     if submit_button:
+        # Drop the previous patient's surface; only a successful prediction rebuilds it
+        st.session_state.pop("response_surface", None)
         start_time = time.time()
-        user_data = {
-            'Pregnancies': pregnancies,
-            'Glucose': glucose,
-            'BloodPressure': blood_pressure,
-            'SkinThickness': skin_thickness,
-            'Insulin': insulin,
-            'BMI': bmi,
-            'DiabetesPedigreeFunction': dpf,
-            'Age': age,
-            'Glucose_BMI': glucose * bmi
-        }
-        user_input = pd.DataFrame(user_data, index=[0])
+        with profiler.stage("build_input"):
+            user_data = {
+                'Pregnancies': pregnancies,
+                'Glucose': glucose,
+                'BloodPressure': blood_pressure,
+                'SkinThickness': skin_thickness,
+                'Insulin': insulin,
+                'BMI': bmi,
+                'DiabetesPedigreeFunction': dpf,
+                'Age': age,
+                'Glucose_BMI': glucose * bmi
+            }
+            user_input = pd.DataFrame(user_data, index=[0])
         
         # Validate input
         if user_input['Glucose'].iloc[0] == 0:
@@ -184,10 +204,12 @@ def main():
             st.warning("BMI value of 0 is invalid. Please enter a realistic value.")
         else:
             try:
-                user_input_scaled = scaler.transform(user_input)
-                prediction = model.predict(user_input_scaled)
-                prediction_proba = model.predict_proba(user_input_scaled)[0]
+                with profiler.stage("predict"):
+                    user_input_scaled = scaler.transform(user_input)
+                    prediction = model.predict(user_input_scaled)
+                    prediction_proba = model.predict_proba(user_input_scaled)[0]
                 elapsed_time = time.time() - start_time
+                drift_monitor.observe(user_input)
 
                 # Display prediction
                 st.header("Your Prediction")
@@ -200,9 +222,23 @@ def main():
                     st.metric("Probability of No Diabetes", f"{prediction_proba[0]:.2%}")
                     st.metric("Prediction Time", f"{elapsed_time:.2f} seconds")
 
+                # What-if curves: one batched booster call per feature
+                st.header("What If?")
+                with profiler.stage("what_if"):
+                    st.markdown("How your predicted risk would change with a different Glucose or BMI, all other metrics unchanged.")
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        glucose_curve = sweep(model, scaler, user_input, {'Glucose': np.arange(40, 201)})
+                        st.line_chart(glucose_curve, x='Glucose', y='Probability')
+                    with col2:
+                        bmi_curve = sweep(model, scaler, user_input, {'BMI': np.arange(15, 50.1, 0.5)})
+                        st.line_chart(bmi_curve, x='BMI', y='Probability')
+
                 # Display suggestions
                 st.header("Personalized Suggestions")
-                suggestions = generate_suggestions(user_input)
+                with profiler.stage("suggestions"):
+                    suggestions = generate_suggestions(user_input)
+                    get_prediction_log().log(user_input, prediction_proba[1], suggestion_rule_ids(suggestions), version)
                 with st.expander("Medical Metrics", expanded=True):
                     if suggestions["Medical Metrics"]:
                         for suggestion in suggestions["Medical Metrics"]:
@@ -213,9 +249,30 @@ def main():
                 with st.expander("Lifestyle Recommendations", expanded=True):
                     for suggestion in suggestions["Lifestyle Recommendations"]:
                         st.markdown(f"<div class='expander-content'>{suggestion}</div>", unsafe_allow_html=True)
+
+                # Optional precomputed surface so the what-if sliders below never call the booster
+                if os.environ.get("DIABETES_RESPONSE_SURFACE") == "1":
+                    st.session_state["response_surface"] = build_surface(model, scaler, user_input)
             except Exception as e:
                 st.error(f"Error making prediction: {e}")
 
+    # What-if sliders answered by interpolation in the response surface (DIABETES_RESPONSE_SURFACE=1)
+    surface = st.session_state.get("response_surface")
+    if surface is not None:
+        st.header("What-If Sliders")
+        st.markdown("Move a slider to see your estimated risk instantly, all other metrics unchanged.")
+        values = {}
+        for col in surface.features:
+            lo, hi, step = FORM_RANGES[col]
+            base = surface.base_row[FEATURE_COLUMNS.index(col)]
+            if isinstance(step, int):
+                values[col] = st.slider(col, min_value=lo, max_value=hi, value=int(base), step=step, key=f"what_if_{col}")
+            else:
+                values[col] = st.slider(col, min_value=float(lo), max_value=float(hi), value=float(base), step=float(step), key=f"what_if_{col}")
+        st.metric("Estimated Probability of Diabetes", f"{surface.query(**values):.2%}")
+        max_error = max([surface.max_error, *surface.axis_errors.values()])
+        st.caption(f"Estimated max lookup error vs. the model (sampled over form values): {max_error:.4f}")
+
     # Footer
     st.markdown("""
     <div class="footer">
@@ -226,4 +283,6 @@ def main():
     """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
+    # Profiling (if enabled) spans the whole run and is released even on early return
+    with request_profiler() as profiler:
+        main(profiler)
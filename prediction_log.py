@@ -0,0 +1,156 @@
+import atexit
+import glob
+import hashlib
+import os
+import queue
+import threading
+import time
+import numpy as np
+import pandas as pd
+import streamlit as st
+from data_cleaner import FEATURE_COLUMNS
+from suggestions import MEDICAL_RULES
+
+# One fixed-width little-endian record per prediction; suggestion rules are a bitmask over MEDICAL_RULES
+RECORD_DTYPE = np.dtype(
+    [('timestamp', '<f8')]
+    + [(col, '<f4') for col in FEATURE_COLUMNS]
+    + [('model_version', 'S12'), ('probability', '<f4'), ('rules', '<u4')]
+)
+
+# Segment header: magic, format version and record size, so a reader can reject foreign files
+MAGIC = b'DPLOG'
+FORMAT_VERSION = 1
+HEADER_SIZE = 16
+
+def model_version(model):
+    """Short content hash of the trained booster, stable across retrains on the same data."""
+    return hashlib.sha1(bytes(model.get_booster().save_raw('json'))).hexdigest()[:12]
+
+def _header():
+    return (MAGIC + bytes([FORMAT_VERSION]) + RECORD_DTYPE.itemsize.to_bytes(2, 'little')).ljust(HEADER_SIZE, b'\0')
+
+def _segments(directory):
+    return sorted(glob.glob(os.path.join(directory, 'segment-*.bin')))
+
+def _segment_path(directory, index):
+    return os.path.join(directory, f'segment-{index:06d}.bin')
+
+class PredictionLog:
+    """Append-only log of scored predictions, written in fixed-size segment files.
+
+    log() only builds one record and enqueues it; a background writer batches
+    queued records and appends them every flush_interval seconds, rolling over to a
+    new segment once segment_bytes is reached. If the queue is full, records are
+    counted in `dropped` rather than blocking the request.
+    """
+
+    def __init__(self, directory, segment_bytes=64 * 1024 * 1024, flush_interval=1.0, queue_size=10000):
+        self.directory = directory
+        self.records_per_segment = max((segment_bytes - HEADER_SIZE) // RECORD_DTYPE.itemsize, 1)
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        os.makedirs(directory, exist_ok=True)
+
+        segments = _segments(directory)
+        self._index = int(os.path.basename(segments[-1])[8:14]) if segments else 1
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._flushed = threading.Condition()
+        self._worker = threading.Thread(target=self._run, name="prediction-log", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def log(self, user_input, probability, rule_ids, version):
+        """Queue one prediction: single-row model input, P(diabetes), suggestion rule IDs and model version."""
+        record = np.zeros(1, dtype=RECORD_DTYPE)
+        record['timestamp'] = time.time()
+        for col, value in zip(FEATURE_COLUMNS, user_input[FEATURE_COLUMNS].to_numpy(dtype=float)[0]):
+            record[col] = value
+        record['model_version'] = version.encode()
+        record['probability'] = probability
+        record['rules'] = sum(1 << rule_id for rule_id in rule_ids)
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        closing = False
+        while not closing:
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                try:
+                    record = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if record is None:
+                    closing = True
+                    break
+                batch.append(record)
+            if batch:
+                self._write(np.concatenate(batch))
+            with self._flushed:
+                self._flushed.notify_all()
+
+    def _write(self, records):
+        while len(records):
+            path = _segment_path(self.directory, self._index)
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            # A torn tail from a crash is ignored by readers and overwritten here
+            stored = max(size - HEADER_SIZE, 0) // RECORD_DTYPE.itemsize
+            room = self.records_per_segment - stored
+            if room <= 0:
+                self._index += 1
+                continue
+            with open(path, 'r+b' if size else 'wb') as f:
+                if not size:
+                    f.write(_header())
+                f.seek(HEADER_SIZE + stored * RECORD_DTYPE.itemsize)
+                f.write(records[:room].tobytes())
+                f.truncate()
+            records = records[room:]
+
+    def flush(self, timeout=5):
+        """Wait until everything queued so far is on disk."""
+        with self._flushed:
+            self._flushed.wait(timeout)
+
+    def close(self, timeout=5):
+        """Write out queued records and stop the writer thread."""
+        if self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join(timeout)
+
+def scan(directory):
+    """Yield each segment as a read-only memory-mapped record array (no copy until accessed)."""
+    for path in _segments(directory):
+        size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+        if header != _header():
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} prediction log segment")
+        count = (size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+        if count:
+            yield np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+
+def read_log(directory):
+    """Load the whole log as a DataFrame with readable timestamps, versions and rule names."""
+    segments = list(scan(directory))
+    records = np.concatenate(segments) if segments else np.zeros(0, dtype=RECORD_DTYPE)
+    log = pd.DataFrame({name: records[name] for name in RECORD_DTYPE.names})
+    log['timestamp'] = pd.to_datetime(log['timestamp'], unit='s')
+    log['model_version'] = log['model_version'].str.decode('ascii')
+    log['rules'] = [[rule for i, rule in enumerate(MEDICAL_RULES) if mask >> i & 1] for mask in log['rules']]
+    return log
+
+def export_parquet(directory, path):
+    """Bulk export the log to a Parquet file for analytics (requires pyarrow or fastparquet)."""
+    log = read_log(directory)
+    log.to_parquet(path, index=False)
+    return len(log)
+
+@st.cache_resource
+def get_prediction_log(directory=None):
+    """One writer per server process; the directory defaults to $PREDICTION_LOG_DIR or ./prediction_logs."""
+    return PredictionLog(directory or os.environ.get('PREDICTION_LOG_DIR', 'prediction_logs'))
\ No newline at end of file
@@ -0,0 +1,130 @@
+import cProfile
+import hmac
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+import streamlit as st
+
+# Only one run is profiled at a time; others run unprofiled rather than wait
+_profile_lock = threading.Lock()
+
+class StageProfiler:
+    """Profile named pipeline stages of one page run and write the results to a run directory.
+
+    Created only by request_profiler() while it holds the profiling lock; use it as a context
+    manager around the run so the lock is released when the run ends.
+
+    For every stage it writes:
+      <NN>-<stage>.prof      cProfile stats (pstats, snakeviz, flameprof)
+      <NN>-<stage>.folded    sampled call stacks in collapsed format (flamegraph.pl, speedscope)
+      <NN>-<stage>.alloc.txt top allocations by line from tracemalloc snapshots
+    """
+
+    def __init__(self, directory, sample_interval=0.005, top_allocations=25):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix=time.strftime("%Y%m%d-%H%M%S-"), dir=directory)
+        self.sample_interval = sample_interval
+        self.top_allocations = top_allocations
+        self._count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        _profile_lock.release()
+
+    @contextmanager
+    def stage(self, name):
+        started_tracing = not tracemalloc.is_tracing()
+        try:
+            if started_tracing:
+                tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            samples = Counter()
+            stop = threading.Event()
+            sampler = threading.Thread(target=self._sample, args=(threading.get_ident(), samples, stop), daemon=True)
+            profile = cProfile.Profile()
+            sampler.start()
+            start = time.perf_counter()
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                elapsed = time.perf_counter() - start
+                stop.set()
+                sampler.join()
+                after = tracemalloc.take_snapshot()
+                # Leave out the profiler's own bookkeeping
+                own = [tracemalloc.Filter(False, __file__), tracemalloc.Filter(False, tracemalloc.__file__)]
+                allocations = after.filter_traces(own).compare_to(before.filter_traces(own), 'lineno')
+                self._write(name, elapsed, profile, samples, allocations)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+    def _sample(self, thread_id, samples, stop):
+        while not stop.wait(self.sample_interval):
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                samples[";".join(reversed(stack))] += 1
+
+    def _write(self, name, elapsed, profile, samples, allocations):
+        self._count += 1
+        prefix = os.path.join(self.directory, f"{self._count:02d}-{name}")
+        profile.dump_stats(prefix + ".prof")
+        with open(prefix + ".folded", "w") as f:
+            for stack, count in samples.most_common():
+                f.write(f"{stack} {count}\n")
+        with open(prefix + ".alloc.txt", "w") as f:
+            f.write(f"Stage {name}: {elapsed * 1000:.1f} ms, net {sum(a.size_diff for a in allocations) / 1024:.1f} KiB allocated\n")
+            f.write("tracemalloc is process-wide: allocations by other sessions running during this stage are included.\n\n")
+            f.write(f"{'Size diff (KiB)':>16} {'Count diff':>11}  Location\n")
+            for stat in allocations[:self.top_allocations]:
+                frame = stat.traceback[0]
+                f.write(f"{stat.size_diff / 1024:16.1f} {stat.count_diff:11d}  {frame.filename}:{frame.lineno}\n")
+
+class _NoProfiler:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def stage(self, name):
+        return nullcontext()
+
+def request_profiler():
+    """Profiler for the current page run, or a no-op one when profiling is off or busy.
+
+    Enabled by DIABETES_PROFILE=1 or the --profile flag (`streamlit run home.py -- --profile`)
+    for every run, or by DIABETES_PROFILE=query for single runs opened with
+    ?profile=<DIABETES_PROFILE_TOKEN>; query mode stays off if no token is configured.
+    Output goes to DIABETES_PROFILE_DIR (default ./profiles).
+    """
+    mode = os.environ.get("DIABETES_PROFILE", "")
+    enabled = mode == "1" or "--profile" in sys.argv
+    if mode == "query":
+        token = os.environ.get("DIABETES_PROFILE_TOKEN", "")
+        try:
+            supplied = st.query_params.get("profile", "")
+        except Exception:
+            supplied = ""
+        enabled = bool(token) and hmac.compare_digest(supplied.encode(), token.encode())
+    if not enabled or not _profile_lock.acquire(blocking=False):
+        return _NoProfiler()
+    try:
+        return StageProfiler(os.environ.get("DIABETES_PROFILE_DIR", "profiles"))
+    except Exception:
+        _profile_lock.release()
+        raise
\ No newline at end of file
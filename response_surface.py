@@ -0,0 +1,152 @@
+import itertools
+import json
+import numpy as np
+from data_cleaner import FEATURE_COLUMNS, recompute_glucose_bmi, record_to_row
+from model_trainer import predict_batch
+
+# (min, max, step) of each input on the predict.py form
+FORM_RANGES = {
+    'Pregnancies': (0, 17, 1),
+    'Glucose': (0, 200, 1),
+    'BloodPressure': (0, 140, 1),
+    'SkinThickness': (0, 99, 1),
+    'Insulin': (0, 846, 1),
+    'BMI': (0.0, 67.1, 0.1),
+    'DiabetesPedigreeFunction': (0.078, 2.42, 0.001),
+    'Age': (21, 81, 1)
+}
+
+# Probabilities are stored as uint16 fixed point: 4x smaller than float64 and still memory-mappable
+PROB_SCALE = 65535
+
+def form_lattice(col):
+    """Every value the predict.py form can submit for a feature."""
+    lo, hi, step = FORM_RANGES[col]
+    return lo + step * np.arange(int(round((hi - lo) / step)) + 1)
+
+def top_features(model, n_features=2):
+    """Rank form inputs by booster importance (the derived Glucose_BMI is not a form input)."""
+    importance = dict(zip(FEATURE_COLUMNS, model.feature_importances_))
+    ranked = sorted(FORM_RANGES, key=lambda col: importance[col], reverse=True)
+    return ranked[:n_features]
+
+class ResponseSurface:
+    """Precomputed P(diabetes) over a regular grid of a few features, all others fixed at a base record."""
+
+    def __init__(self, features, axes, table, base_row, max_error=None, axis_errors=None):
+        self.features = list(features)
+        self.axes = [(float(lo), float(hi), int(n)) for lo, hi, n in axes]
+        self.table = table
+        self.base_row = np.asarray(base_row, dtype=float)
+        self.max_error = max_error
+        self.axis_errors = axis_errors or {}
+        self._lo = np.array([lo for lo, _, _ in self.axes])
+        self._hi = np.array([hi for _, hi, _ in self.axes])
+        self._step = (self._hi - self._lo) / (np.array(table.shape) - 1)
+        self._last = np.array(table.shape) - 2
+        self._corners = np.array(list(itertools.product((0, 1), repeat=len(self.features))))
+
+    def query_batch(self, points):
+        """Multilinear interpolation for an (n, k) array of grid-feature values; each lookup is O(2^k)."""
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        pos = (np.clip(points, self._lo, self._hi) - self._lo) / self._step
+        cell = np.minimum(pos.astype(int), self._last)
+        frac = pos - cell
+        idx = cell[:, None, :] + self._corners[None, :, :]
+        weights = np.prod(np.where(self._corners[None, :, :], frac[:, None, :], 1 - frac[:, None, :]), axis=2)
+        values = self.table[tuple(idx[..., d] for d in range(len(self.features)))]
+        return (weights * values).sum(axis=1) / PROB_SCALE
+
+    def query(self, **values):
+        """What-if lookup: move any grid features (e.g. Glucose=140) and get the interpolated probability."""
+        unknown = set(values) - set(self.features)
+        if unknown:
+            raise ValueError(f"Features {sorted(unknown)} are not on the grid {self.features}")
+        point = [values.get(col, self.base_row[FEATURE_COLUMNS.index(col)]) for col in self.features]
+        return float(self.query_batch([point])[0])
+
+    def _errors(self, model, scaler, points):
+        batch = np.tile(self.base_row, (len(points), 1))
+        for d, col in enumerate(self.features):
+            batch[:, FEATURE_COLUMNS.index(col)] = points[:, d]
+        exact = predict_batch(model, scaler, recompute_glucose_bmi(batch))
+        return np.abs(self.query_batch(points) - exact)
+
+    def measure_error(self, model, scaler, n_samples=2000, seed=42):
+        """Max absolute difference between the table and the real model for values the form can submit.
+
+        Points are drawn from the form's step lattice. max_error covers all grid features together;
+        axis_errors isolates each axis thinned by max_points (the others held on table nodes),
+        since only those axes are actually interpolated.
+        """
+        rng = np.random.default_rng(seed)
+        lattices = [form_lattice(col) for col in self.features]
+        points = np.column_stack([rng.choice(lattice, n_samples) for lattice in lattices])
+        self.max_error = float(self._errors(model, scaler, points).max())
+
+        self.axis_errors = {}
+        for d, (col, lattice, (lo, hi, n)) in enumerate(zip(self.features, lattices, self.axes)):
+            if n >= len(lattice):
+                continue
+            points = np.column_stack([
+                rng.choice(lattice, n_samples) if e == d else rng.choice(np.linspace(lo_e, hi_e, n_e), n_samples)
+                for e, (lo_e, hi_e, n_e) in enumerate(self.axes)
+            ])
+            self.axis_errors[col] = float(self._errors(model, scaler, points).max())
+        return self.max_error
+
+    def save(self, path):
+        """Write the table to <path>.npy and its grid metadata to <path>.json."""
+        np.save(f"{path}.npy", np.ascontiguousarray(self.table))
+        meta = {
+            'features': self.features,
+            'axes': self.axes,
+            'base_row': self.base_row.tolist(),
+            'max_error': self.max_error,
+            'axis_errors': self.axis_errors
+        }
+        with open(f"{path}.json", "w") as f:
+            json.dump(meta, f)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Open a saved surface; with mmap the table is paged in lazily instead of read up front."""
+        with open(f"{path}.json") as f:
+            meta = json.load(f)
+        table = np.load(f"{path}.npy", mmap_mode="r" if mmap else None)
+        return cls(meta['features'], meta['axes'], table, meta['base_row'], meta['max_error'], meta.get('axis_errors'))
+
+def build_surface(model, scaler, record, features=None, n_features=2, max_points=201, path=None):
+    """Tabulate the model over a grid of the most important features for one patient record.
+
+    Each axis follows the form's step, thinned to at most max_points values. The whole grid
+    is scored with a single booster call. If path is given the table is saved and reopened
+    memory-mapped.
+    """
+    if features is None:
+        features = top_features(model, n_features)
+    unknown = [col for col in features if col not in FORM_RANGES]
+    if unknown:
+        raise ValueError(f"Cannot tabulate {unknown}; choose from {list(FORM_RANGES)}")
+    if max_points < 2:
+        raise ValueError("max_points must be at least 2")
+
+    axes = []
+    for col in features:
+        lo, hi, _ = FORM_RANGES[col]
+        axes.append((lo, hi, min(len(form_lattice(col)), max_points)))
+
+    base_row = record_to_row(record)
+    mesh = np.meshgrid(*[np.linspace(lo, hi, n) for lo, hi, n in axes], indexing='ij')
+    batch = np.tile(base_row, (mesh[0].size, 1))
+    for col, values in zip(features, mesh):
+        batch[:, FEATURE_COLUMNS.index(col)] = values.ravel()
+    proba = predict_batch(model, scaler, recompute_glucose_bmi(batch))
+    table = np.round(proba * PROB_SCALE).astype(np.uint16).reshape(mesh[0].shape)
+
+    surface = ResponseSurface(features, axes, table, base_row)
+    surface.measure_error(model, scaler)
+    if path is not None:
+        surface.save(path)
+        surface = ResponseSurface.load(path)
+    return surface
\ No newline at end of file
@@ -1,9 +1,28 @@
+# Medical metric rules in a fixed order; a rule's ID is its index here (used to log suggestions compactly)
+MEDICAL_RULES = [
+    "High Glucose", "Elevated Glucose", "Low Glucose",
+    "Obesity", "Overweight", "Underweight",
+    "High Blood Pressure", "Elevated Blood Pressure", "Low Blood Pressure",
+    "High Insulin", "Low Insulin",
+    "High Skin Thickness", "Low Skin Thickness",
+    "Multiple Pregnancies", "Pregnancy History",
+    "Genetic Risk", "Moderate Genetic Risk",
+    "AgeRelated Risk", "Age Consideration"
+]
+
 def generate_suggestions(user_data):
     """Generate comprehensive personalized suggestions for diabetes risk reduction."""
     suggestions = {
         "Medical Metrics": [],
-        "Lifestyle Recommendations": []
+        "Lifestyle Recommendations": [],
+        "Rule IDs": []
     }
+
+    def add_rule(rule, message):
+        # Record the rule's ID with its message so logging never has to parse display text
+        suggestions["Medical Metrics"].append(message)
+        suggestions["Rule IDs"].append(MEDICAL_RULES.index(rule))
+
     pregnancies = user_data['Pregnancies'].iloc[0]
     glucose = user_data['Glucose'].iloc[0]
     blood_pressure = user_data['BloodPressure'].iloc[0]
@@ -15,50 +34,50 @@ def generate_suggestions(user_data):
 
     # Medical Metrics Suggestions (based on CDC, WHO, ADA guidelines)
     if glucose > 126:
-        suggestions["Medical Metrics"].append(" High Glucose: Your glucose level (>126 mg/dL) suggests possible diabetes. Consult a healthcare provider for an A1C test and adopt a lowglycemic diet (e.g., whole grains, leafy greens, lean proteins).")
+        add_rule("High Glucose", " High Glucose: Your glucose level (>126 mg/dL) suggests possible diabetes. Consult a healthcare provider for an A1C test and adopt a lowglycemic diet (e.g., whole grains, leafy greens, lean proteins).")
     elif glucose > 100:
-        suggestions["Medical Metrics"].append(" Elevated Glucose: Your glucose (100-126 mg/dL) indicates prediabetes risk. Monitor blood sugar regularly and reduce intake of refined sugars and highcarb foods.")
+        add_rule("Elevated Glucose", " Elevated Glucose: Your glucose (100-126 mg/dL) indicates prediabetes risk. Monitor blood sugar regularly and reduce intake of refined sugars and highcarb foods.")
     elif glucose < 70:
-        suggestions["Medical Metrics"].append(" Low Glucose: Your glucose (<70 mg/dL) is below normal. Consult a doctor to rule out hypoglycemia and ensure balanced meals with complex carbohydrates.")
+        add_rule("Low Glucose", " Low Glucose: Your glucose (<70 mg/dL) is below normal. Consult a doctor to rule out hypoglycemia and ensure balanced meals with complex carbohydrates.")
 
     if bmi > 30:
-        suggestions["Medical Metrics"].append(" Obesity: Your BMI (>30) indicates obesity, a major diabetes risk factor. Work with a dietitian to create a weight loss plan targeting 510% body weight reduction through diet and exercise.")
+        add_rule("Obesity", " Obesity: Your BMI (>30) indicates obesity, a major diabetes risk factor. Work with a dietitian to create a weight loss plan targeting 510% body weight reduction through diet and exercise.")
     elif bmi > 25:
-        suggestions["Medical Metrics"].append(" Overweight: Your BMI (25-30) suggests overweight. Aim for a balanced diet and 150 min/week of moderate exercise (e.g., brisk walking) to reach a BMI below 25.")
+        add_rule("Overweight", " Overweight: Your BMI (25-30) suggests overweight. Aim for a balanced diet and 150 min/week of moderate exercise (e.g., brisk walking) to reach a BMI below 25.")
     elif bmi < 18.5:
-        suggestions["Medical Metrics"].append(" Underweight: Your BMI (<18.5) is below normal. Consult a healthcare provider to ensure adequate nutrition and rule out underlying conditions.")
+        add_rule("Underweight", " Underweight: Your BMI (<18.5) is below normal. Consult a healthcare provider to ensure adequate nutrition and rule out underlying conditions.")
 
     if blood_pressure > 130:
-        suggestions["Medical Metrics"].append(" High Blood Pressure: Your blood pressure (>130 mm Hg) indicates hypertension. Reduce salt intake, manage stress, and consult a doctor for medication or monitoring.")
+        add_rule("High Blood Pressure", " High Blood Pressure: Your blood pressure (>130 mm Hg) indicates hypertension. Reduce salt intake, manage stress, and consult a doctor for medication or monitoring.")
     elif blood_pressure > 120:
-        suggestions["Medical Metrics"].append(" Elevated Blood Pressure: Your blood pressure (120-130 mm Hg) is above optimal. Limit sodium, increase physical activity, and monitor regularly.")
+        add_rule("Elevated Blood Pressure", " Elevated Blood Pressure: Your blood pressure (120-130 mm Hg) is above optimal. Limit sodium, increase physical activity, and monitor regularly.")
     elif blood_pressure < 90:
-        suggestions["Medical Metrics"].append(" Low Blood Pressure: Your blood pressure (<90 mm Hg) is below normal. Consult a doctor to address potential causes and ensure proper hydration.")
+        add_rule("Low Blood Pressure", " Low Blood Pressure: Your blood pressure (<90 mm Hg) is below normal. Consult a doctor to address potential causes and ensure proper hydration.")
 
     if insulin > 200:
-        suggestions["Medical Metrics"].append(" High Insulin: Your insulin level (>200 mu U/ml) suggests insulin resistance. Consult an endocrinologist and focus on lowcarb diets and regular exercise to improve insulin sensitivity.")
+        add_rule("High Insulin", " High Insulin: Your insulin level (>200 mu U/ml) suggests insulin resistance. Consult an endocrinologist and focus on lowcarb diets and regular exercise to improve insulin sensitivity.")
     elif insulin < 20:
-        suggestions["Medical Metrics"].append(" Low Insulin: Your insulin level (<20 mu U/ml) is below typical ranges. Consult a doctor to evaluate pancreatic function and diabetes risk.")
+        add_rule("Low Insulin", " Low Insulin: Your insulin level (<20 mu U/ml) is below typical ranges. Consult a doctor to evaluate pancreatic function and diabetes risk.")
 
     if skin_thickness > 40:
-        suggestions["Medical Metrics"].append(" High Skin Thickness: Your skin thickness (>40 mm) may indicate higher fat deposits. Combine aerobic exercise (e.g., running) and strength training to reduce body fat.")
+        add_rule("High Skin Thickness", " High Skin Thickness: Your skin thickness (>40 mm) may indicate higher fat deposits. Combine aerobic exercise (e.g., running) and strength training to reduce body fat.")
     elif skin_thickness < 10:
-        suggestions["Medical Metrics"].append(" Low Skin Thickness: Your skin thickness (<10 mm) is below typical ranges. Ensure adequate nutrition and consult a doctor if related to weight loss or other conditions.")
+        add_rule("Low Skin Thickness", " Low Skin Thickness: Your skin thickness (<10 mm) is below typical ranges. Ensure adequate nutrition and consult a doctor if related to weight loss or other conditions.")
 
     if pregnancies > 4:
-        suggestions["Medical Metrics"].append(" Multiple Pregnancies: Having more than 4 pregnancies increases gestational diabetes risk. Discuss screening with your doctor, especially if planning future pregnancies.")
+        add_rule("Multiple Pregnancies", " Multiple Pregnancies: Having more than 4 pregnancies increases gestational diabetes risk. Discuss screening with your doctor, especially if planning future pregnancies.")
     elif pregnancies > 0:
-        suggestions["Medical Metrics"].append(" Pregnancy History: Previous pregnancies may increase diabetes risk. Maintain a healthy weight and monitor blood sugar, especially postpregnancy.")
+        add_rule("Pregnancy History", " Pregnancy History: Previous pregnancies may increase diabetes risk. Maintain a healthy weight and monitor blood sugar, especially postpregnancy.")
 
     if dpf > 0.5:
-        suggestions["Medical Metrics"].append(" Genetic Risk: Your Diabetes Pedigree Function (>0.5) indicates a higher genetic predisposition. Schedule regular screenings and adopt a proactive healthy lifestyle.")
+        add_rule("Genetic Risk", " Genetic Risk: Your Diabetes Pedigree Function (>0.5) indicates a higher genetic predisposition. Schedule regular screenings and adopt a proactive healthy lifestyle.")
     elif dpf > 0.2:
-        suggestions["Medical Metrics"].append(" Moderate Genetic Risk: Your Diabetes Pedigree Function (0.20.5) suggests some genetic risk. Stay vigilant with annual checkups and healthy habits.")
+        add_rule("Moderate Genetic Risk", " Moderate Genetic Risk: Your Diabetes Pedigree Function (0.20.5) suggests some genetic risk. Stay vigilant with annual checkups and healthy habits.")
 
     if age > 45:
-        suggestions["Medical Metrics"].append(" AgeRelated Risk: Being over 45 increases diabetes risk. Schedule annual checkups, maintain a healthy weight, and monitor blood sugar regularly.")
+        add_rule("AgeRelated Risk", " AgeRelated Risk: Being over 45 increases diabetes risk. Schedule annual checkups, maintain a healthy weight, and monitor blood sugar regularly.")
     elif age > 30:
-        suggestions["Medical Metrics"].append(" Age Consideration: Being over 30, especially with other risk factors, warrants attention. Incorporate regular exercise and a balanced diet to reduce risk.")
+        add_rule("Age Consideration", " Age Consideration: Being over 30, especially with other risk factors, warrants attention. Incorporate regular exercise and a balanced diet to reduce risk.")
 
     # Lifestyle Recommendations (applicable to all)
     suggestions["Lifestyle Recommendations"].extend([
@@ -73,4 +92,8 @@ def generate_suggestions(user_data):
         " Hydration: Drink adequate water (810 cups/day) to support overall health and kidney function, especially if glucose levels are high."
     ])
 
-    return suggestions
\ No newline at end of file
+    return suggestions
+
+def suggestion_rule_ids(suggestions):
+    """IDs (indices into MEDICAL_RULES) of the medical metric rules that produced the suggestions."""
+    return suggestions["Rule IDs"]
\ No newline at end of file
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+from data_cleaner import FEATURE_COLUMNS, recompute_glucose_bmi, record_to_row
+from model_trainer import predict_batch
+
+def sweep(model, scaler, record, grid, relative=False):
+    """Score a patient record with one or two features varied over a grid.
+
+    grid maps each varied feature to the values to try, e.g. {'Glucose': np.arange(80, 201)}.
+    With relative=True the values are offsets from the record (e.g. {'BMI': -np.arange(0, 6)}).
+    Every perturbed row is built as a single NumPy batch, Glucose_BMI is recomputed, and the
+    batch is scored with one booster call. Returns a long DataFrame with one column per varied
+    feature plus 'Probability', ready for line charts (1-D) or pivoting into a heatmap (2-D).
+    """
+    if not 1 <= len(grid) <= 2:
+        raise ValueError(f"Sweep one or two features, got {len(grid)}")
+    unknown = [col for col in grid if col not in FEATURE_COLUMNS[:-1]]
+    if unknown:
+        raise ValueError(f"Cannot sweep {unknown}; choose from {FEATURE_COLUMNS[:-1]}")
+
+    base_row = record_to_row(record)
+    axes = []
+    for col, values in grid.items():
+        values = np.asarray(values, dtype=float).ravel()
+        if relative:
+            values = values + base_row[FEATURE_COLUMNS.index(col)]
+        axes.append(values)
+
+    mesh = np.meshgrid(*axes, indexing='ij')
+    batch = np.tile(base_row, (mesh[0].size, 1))
+    for col, values in zip(grid, mesh):
+        batch[:, FEATURE_COLUMNS.index(col)] = values.ravel()
+    proba = predict_batch(model, scaler, recompute_glucose_bmi(batch))
+
+    curve = pd.DataFrame({col: values.ravel() for col, values in zip(grid, mesh)})
+    curve['Probability'] = proba
+    return curve
\ No newline at end of file